@@ -20,16 +20,40 @@ Go down to the "run_example()" function to start the example.
 SPDX-FileCopyrightText: 2019 oemof developer group <contact@oemof.org>
 SPDX-License-Identifier: MIT
 """
+import importlib.util
 import os
+import pickle
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
 import requests
 import logging
 from windpowerlib import ModelChain, WindTurbine, create_power_curve
 
+# matplotlib is optional and only imported when plotting, see get_pyplot()
+has_matplotlib = importlib.util.find_spec("matplotlib") is not None
+
+# use the faster pyarrow csv engine to read the weather data if available
 try:
-    from matplotlib import pyplot as plt
+    import pyarrow  # noqa: F401
+
+    csv_engine = "pyarrow"
 except ImportError:
-    plt = None
+    csv_engine = "c"
+
+# time zone of the weather data, created once instead of on every call
+weather_tz = ZoneInfo("Europe/Berlin")
+
+# directory of this example, which is the default location of the weather data
+default_datapath = os.path.dirname(__file__)
+
+# version of the format of the cached weather data, increase it whenever the
+# data returned by get_weather_data() changes, so that old caches are not used
+weather_cache_version = 2
 
 
 def get_weather_data(filename="weather.csv", **kwargs):
@@ -42,6 +66,12 @@ def get_weather_data(filename="weather.csv", **kwargs):
     specified in the second row.
     In case no weather data file exists, an example weather data file is
     automatically downloaded and stored in the same directory as this example.
+    The parsed weather data is cached in a pickle file next to the weather
+    data file. The cache is used instead of the csv file as long as the
+    modification time and size of the csv file and the format version
+    `weather_cache_version` are the same as when the cache was written. The
+    csv file is read again if the pickle file cannot be read, e.g. because it
+    was written by an incompatible pandas version.
 
     Parameters
     ----------
@@ -53,10 +83,16 @@ def get_weather_data(filename="weather.csv", **kwargs):
     datapath : str, optional
         Path where the weather data file is stored.
         Default is the same directory this example is stored in.
+    chunksize : int, optional
+        If set, the weather data file is not read at once but returned as an
+        iterator of DataFrames with `chunksize` time steps each, e.g. for
+        weather data files that do not fit into memory. The pickle cache is
+        not used in that case. See :py:func:`~.run_model_streaming`.
+        Default: None.
 
     Returns
     -------
-    :pandas:`pandas.DataFrame<frame>`
+    :pandas:`pandas.DataFrame<frame>` or iterator
         DataFrame with time series for wind speed `wind_speed` in m/s,
         temperature `temperature` in K, roughness length `roughness_length`
         in m, and pressure `pressure` in Pa.
@@ -68,32 +104,184 @@ def get_weather_data(filename="weather.csv", **kwargs):
 
     """
 
-    if "datapath" not in kwargs:
-        kwargs["datapath"] = os.path.dirname(__file__)
-
-    file = os.path.join(kwargs["datapath"], filename)
+    file = os.path.join(kwargs.get("datapath", default_datapath), filename)
 
     # download example weather data file in case it does not yet exist
     if not os.path.isfile(file):
         logging.debug("Download weather data for example.")
-        req = requests.get("https://osf.io/59bqn/download")
-        with open(file, "wb") as fout:
-            fout.write(req.content)
+        with requests.get(
+            "https://osf.io/59bqn/download", stream=True
+        ) as req, open(file, "wb") as fout:
+            # decode compressed responses while streaming them to disk
+            req.raw.decode_content = True
+            shutil.copyfileobj(req.raw, fout, length=1 << 20)
+
+    if kwargs.get("chunksize") is not None:
+        return read_weather_data_chunks(file, kwargs["chunksize"])
+
+    # use cached weather data if it was created from the same csv file in the
+    # same format
+    cache = file + ".pkl"
+    stat = os.stat(file)
+    cache_key = (weather_cache_version, stat.st_mtime_ns, stat.st_size)
+    if os.path.isfile(cache):
+        try:
+            cached = pd.read_pickle(cache)
+            if isinstance(cached, dict) and cached.get("key") == cache_key:
+                return cached["weather"]
+            msg = "Cached weather data in {} is outdated."
+            logging.debug(msg.format(cache))
+        except (
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+            IndexError,
+            TypeError,
+            ValueError,
+        ) as e:
+            msg = "Cached weather data in {0} could not be read: {1}"
+            logging.debug(msg.format(cache, e))
 
     # read csv file
-    weather_df = pd.read_csv(
-        file,
-        index_col=0,
-        header=[0, 1],
-    )
-    weather_df.index = pd.to_datetime(weather_df.index, utc=True)
+    if csv_engine == "pyarrow":
+        # the pyarrow engine does not support a multi-row header, therefore
+        # the header is read separately
+        columns = pd.read_csv(file, index_col=0, header=[0, 1], nrows=0)
+        weather_df = pd.read_csv(
+            file,
+            index_col=0,
+            header=None,
+            skiprows=2,
+            engine="pyarrow",
+        )
+        weather_df.columns = columns.columns
+        weather_df.index.name = None
+    else:
+        weather_df = pd.read_csv(
+            file,
+            index_col=0,
+            header=[0, 1],
+        )
+    weather_df = _format_weather_data(weather_df)
+    _write_weather_cache({"key": cache_key, "weather": weather_df}, cache)
+    return weather_df
+
+
+def _write_weather_cache(cached, cache):
+    r"""
+    Writes the weather data and its cache key to the pickle file `cache`.
+
+    The data is written to a temporary file first, which then replaces the
+    cache. Thus, a crash or a concurrent reader never sees a partly written
+    cache.
+
+    """
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(cache), suffix=".tmp")
+        os.close(fd)
+        pd.to_pickle(cached, tmp)
+        os.replace(tmp, cache)
+    except OSError:
+        logging.debug("Weather data could not be cached in {}.".format(cache))
+        if tmp is not None and os.path.isfile(tmp):
+            os.remove(tmp)
+
+
+def read_weather_data_chunks(file, chunksize):
+    r"""
+    Reads a weather data file in chunks.
+
+    Parameters
+    ----------
+    file : str
+        Path of the weather data file.
+    chunksize : int
+        Number of time steps per chunk.
+
+    Yields
+    ------
+    :pandas:`pandas.DataFrame<frame>`
+        Weather data of `chunksize` time steps in the format returned by
+        :py:func:`~.get_weather_data`.
 
-    # change time zone
-    weather_df.index = weather_df.index.tz_convert("Europe/Berlin")
+    """
+    with pd.read_csv(
+        file, index_col=0, header=[0, 1], chunksize=chunksize
+    ) as reader:
+        for weather_df in reader:
+            yield _format_weather_data(weather_df)
+
+
+def _format_weather_data(weather_df):
+    r"""
+    Converts the data heights to integers and the index to local time.
+
+    The heights are read as strings. The columns are built from their level
+    values, as this does not depend on the levels being unique after the
+    conversion.
 
+    """
+    weather_df.columns = pd.MultiIndex.from_arrays(
+        [
+            weather_df.columns.get_level_values(0),
+            weather_df.columns.get_level_values(1).astype(int),
+        ]
+    )
+    # the pyarrow engine already parses the index, the c engine does not
+    if not isinstance(weather_df.index, pd.DatetimeIndex):
+        weather_df.index = pd.to_datetime(
+            weather_df.index, utc=True, cache=True
+        )
+    elif weather_df.index.tz is None:
+        # time stamps without UTC offset are read as UTC, as by the c engine
+        weather_df.index = weather_df.index.tz_localize("UTC")
+    # the pyarrow engine parses the index with a resolution of seconds, the
+    # resolution is unified so that the data does not depend on the engine
+    # (DatetimeIndex.as_unit() would need pandas >= 2.0)
+    weather_df.index = (
+        weather_df.index.tz_convert("UTC")
+        .astype("datetime64[ns, UTC]")
+        .tz_convert(weather_tz)
+    )
     return weather_df
 
 
+def run_model_streaming(model_chain, weather_chunks):
+    r"""
+    Runs a :class:`~.modelchain.ModelChain` on chunks of weather data.
+
+    Only one chunk of weather data is held in memory at a time. This gives the
+    same power output as running the model on the whole weather data, as the
+    models of the :class:`~.modelchain.ModelChain` treat every time step on
+    its own. This does not apply to the
+    :class:`~.turbine_cluster_modelchain.TurbineClusterModelChain`, which
+    averages the roughness length and turbulence intensity over all time
+    steps.
+
+    Parameters
+    ----------
+    model_chain : :class:`~.modelchain.ModelChain`
+        ModelChain to run.
+    weather_chunks : iterable of :pandas:`pandas.DataFrame<frame>`
+        Weather data chunks, e.g. returned by :py:func:`~.get_weather_data`
+        with `chunksize`.
+
+    Returns
+    -------
+    :class:`~.modelchain.ModelChain`
+        `model_chain` with the power output of all chunks in `power_output`.
+
+    """
+    power_output = [
+        model_chain.run_model(weather_df).power_output
+        for weather_df in weather_chunks
+    ]
+    model_chain.power_output = pd.concat(power_output)
+    return model_chain
+
+
 def initialize_wind_turbines():
     r"""
     Initializes three :class:`~.wind_turbine.WindTurbine` objects.
@@ -132,15 +320,19 @@ def initialize_wind_turbines():
     my_turbine = {
         "nominal_power": 3e6,  # in W
         "hub_height": 105,  # in m
-        "power_curve": pd.DataFrame(
-            data={
-                "value": [
-                    p * 1000
-                    for p in [0.0, 26.0, 180.0, 1500.0, 3000.0, 3000.0]
-                ],  # in W
-                "wind_speed": [0.0, 3.0, 5.0, 10.0, 15.0, 25.0],
-            }
-        ),  # in m/s
+        # the power curve can also be a DataFrame or dictionary with
+        # 'wind_speed' and 'value' columns/keys
+        "power_curve": np.array(
+            [
+                (0.0, 0.0),
+                (3.0, 26e3),
+                (5.0, 180e3),
+                (10.0, 1500e3),
+                (15.0, 3000e3),
+                (25.0, 3000e3),
+            ],  # in m/s and W
+            dtype=[("wind_speed", "f8"), ("value", "f8")],
+        ),
     }
     my_turbine = WindTurbine(**my_turbine)
 
@@ -213,28 +405,103 @@ def calculate_power_output(weather, my_turbine, e126, my_turbine2):
         "obstacle_height": 0,  # default: 0
         "hellman_exp": None,
     }  # None (default) or None
-    # initialize ModelChain with own specifications and use run_model method
-    # to calculate power output
-    mc_e126 = ModelChain(e126, **modelchain_data).run_model(weather)
-    # write power output time series to WindTurbine object
-    e126.power_output = mc_e126.power_output
+    # initialize ModelChain with own specifications
+    mc_e126 = ModelChain(e126, **modelchain_data)
 
     # ************************************************************************
     # **** ModelChain with default parameter *********************************
-    mc_my_turbine = ModelChain(my_turbine).run_model(weather)
-    # write power output time series to WindTurbine object
-    my_turbine.power_output = mc_my_turbine.power_output
+    mc_my_turbine = ModelChain(my_turbine)
 
     # ************************************************************************
     # **** ModelChain with non-default value for "wind_speed_model" **********
-    mc_example_turbine = ModelChain(
-        my_turbine2, wind_speed_model="hellman"
-    ).run_model(weather)
-    my_turbine2.power_output = mc_example_turbine.power_output
+    mc_example_turbine = ModelChain(my_turbine2, wind_speed_model="hellman")
+
+    # ************************************************************************
+    # **** Run the ModelChains ***********************************************
+    # The ModelChains are independent of each other. Therefore, their
+    # run_model methods can be called concurrently. Each one gets its own
+    # shallow copy of the weather data, as run_model converts data heights
+    # given as strings in place.
+    model_chains = [mc_e126, mc_my_turbine, mc_example_turbine]
+    with ThreadPoolExecutor(max_workers=len(model_chains)) as executor:
+        for mc in executor.map(
+            lambda x: x.run_model(weather.copy(deep=False)), model_chains
+        ):
+            # write power output time series to WindTurbine object
+            mc.power_plant.power_output = mc.power_output
 
     return
 
 
+def get_pyplot():
+    r"""
+    Imports matplotlib.pyplot on first use.
+
+    If the example is not run interactively, e.g. in batch jobs or benchmarks,
+    the non-interactive Agg backend is selected, so that the plots are saved
+    instead of opening windows (notebooks are excluded). Set the environment
+    variable `MPLBACKEND` to choose the backend yourself.
+
+    Returns
+    -------
+    module or None
+        matplotlib.pyplot or None if matplotlib is not installed.
+
+    """
+    if not has_matplotlib:
+        return None
+    import matplotlib
+
+    if (
+        not sys.stdout.isatty()
+        and "ipykernel" not in sys.modules
+        and "MPLBACKEND" not in os.environ
+    ):
+        logging.info(
+            "Output is not a terminal, plots are saved instead of shown."
+        )
+        matplotlib.use("Agg")
+    from matplotlib import pyplot as plt
+
+    return plt
+
+
+def show_plot(filename, path=None):
+    r"""
+    Shows the current figure and closes all figures afterwards.
+
+    If matplotlib uses the non-interactive Agg backend, e.g. because the
+    example is run in a batch job, the figure is saved to `filename` in `path`
+    instead.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file the figure is saved to when it cannot be shown.
+    path : str, optional
+        Directory the figure is saved to when it cannot be shown.
+        Default is the current working directory.
+
+    """
+    import matplotlib
+    from matplotlib import pyplot as plt
+
+    if matplotlib.get_backend().lower() == "agg":
+        file = os.path.join(os.getcwd() if path is None else path, filename)
+        try:
+            plt.savefig(file)
+        except OSError as e:
+            msg = "Figure could not be saved to {0}: {1}"
+            logging.warning(msg.format(file, e))
+        else:
+            logging.info("Figure saved to {}.".format(file))
+    else:
+        plt.show()
+    # plt.show() displays all open figures, therefore all of them are closed
+    # to free their memory, e.g. when the example is run repeatedly
+    plt.close("all")
+
+
 def plot_or_print(my_turbine, e126, my_turbine2):
     r"""
     Plots or prints power output and power (coefficient) curves.
@@ -250,53 +517,51 @@ def plot_or_print(my_turbine, e126, my_turbine2):
         WindTurbine object with power coefficient curve from example file.
 
     """
+    plt = get_pyplot()
 
-    # plot or print turbine power output
-    if plt:
-        e126.power_output.plot(legend=True, label="Enercon E126")
-        my_turbine.power_output.plot(legend=True, label="myTurbine")
-        my_turbine2.power_output.plot(legend=True, label="myTurbine2")
-        plt.xlabel("Time")
-        plt.ylabel("Power in W")
-        plt.show()
-    else:
-        print(e126.power_output)
-        print(my_turbine.power_output)
-        print(my_turbine2.power_output)
-
-    # plot or print power curve
+    # plot or print turbine power output and power curves
     if plt:
-        if e126.power_curve is not False:
-            e126.power_curve.plot(
-                x="wind_speed",
-                y="value",
-                style="*",
-                title="Enercon E126 power curve",
-            )
-            plt.xlabel("Wind speed in m/s")
-            plt.ylabel("Power coefficient $\mathrm{C}_\mathrm{P}$")
-            plt.show()
-        if my_turbine.power_curve is not False:
-            my_turbine.power_curve.plot(
-                x="wind_speed",
-                y="value",
-                style="*",
-                title="myTurbine power curve",
-            )
-            plt.xlabel("Wind speed in m/s")
-            plt.ylabel("Power in W")
-            plt.show()
-        if my_turbine2.power_curve is not False:
-            my_turbine2.power_curve.plot(
+        # draw everything into one figure, which is shown once, with the power
+        # output in the upper half and the power curves below it
+        fig = plt.figure(figsize=(15, 8))
+        ax = fig.add_subplot(2, 1, 1)
+        pd.DataFrame(
+            {
+                "Enercon E126": e126.power_output,
+                "myTurbine": my_turbine.power_output,
+                "myTurbine2": my_turbine2.power_output,
+            }
+        ).plot(ax=ax)
+        ax.set_xlabel("Time")
+        ax.set_ylabel("Power in W")
+        for position, (turbine, title) in enumerate(
+            [
+                (e126, "Enercon E126 power curve"),
+                (my_turbine, "myTurbine power curve"),
+                (my_turbine2, "myTurbine2 power curve"),
+            ],
+            start=4,
+        ):
+            ax = fig.add_subplot(2, 3, position)
+            if turbine.power_curve is None:
+                ax.set_visible(False)
+                continue
+            turbine.power_curve.plot(
                 x="wind_speed",
                 y="value",
                 style="*",
-                title="myTurbine2 power curve",
+                title=title,
+                legend=False,
+                ax=ax,
             )
-            plt.xlabel("Wind speed in m/s")
-            plt.ylabel("Power in W")
-            plt.show()
+            ax.set_xlabel("Wind speed in m/s")
+            ax.set_ylabel("Power in W")
+        plt.tight_layout()
+        show_plot("power_output.png")
     else:
+        print(e126.power_output)
+        print(my_turbine.power_output)
+        print(my_turbine2.power_output)
         if e126.power_coefficient_curve is not False:
             print(e126.power_coefficient_curve)
         if e126.power_curve is not False:
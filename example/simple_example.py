@@ -10,10 +10,11 @@ of wind turbines, are imported and used without further explanations.
 SPDX-FileCopyrightText: 2019 oemof developer group <contact@oemof.org>
 SPDX-License-Identifier: MIT
 """
-import pandas as pd
-import requests
-import os
-
+try:
+    from example import modelchain_example as mc_e
+except ModuleNotFoundError:
+    # the example is run from within the example directory
+    import modelchain_example as mc_e
 from windpowerlib import WindFarm
 from windpowerlib import WindTurbine
 from windpowerlib import TurbineClusterModelChain
@@ -26,74 +27,12 @@ import logging
 logging.getLogger().setLevel(logging.INFO)
 
 
-def get_weather_data(filename="weather.csv", **kwargs):
-    r"""
-    Imports weather data from a file.
-
-    The data include wind speed at two different heights in m/s, air
-    temperature in two different heights in K, surface roughness length in m
-    and air pressure in Pa. The height in m for which the data applies is
-    specified in the second row.
-    In case no weather data file exists, an example weather data file is
-    automatically downloaded and stored in the same directory as this example.
-
-    Parameters
-    ----------
-    filename : str
-        Filename of the weather data file. Default: 'weather.csv'.
-
-    Other Parameters
-    ----------------
-    datapath : str, optional
-        Path where the weather data file is stored.
-        Default is the same directory this example is stored in.
-
-    Returns
-    -------
-    :pandas:`pandas.DataFrame<frame>`
-        DataFrame with time series for wind speed `wind_speed` in m/s,
-        temperature `temperature` in K, roughness length `roughness_length`
-        in m, and pressure `pressure` in Pa.
-        The columns of the DataFrame are a MultiIndex where the first level
-        contains the variable name as string (e.g. 'wind_speed') and the
-        second level contains the height as integer at which it applies
-        (e.g. 10, if it was measured at a height of 10 m). The index is a
-        DateTimeIndex.
-
-    """
-
-    if "datapath" not in kwargs:
-        kwargs["datapath"] = os.path.dirname(__file__)
-
-    file = os.path.join(kwargs["datapath"], filename)
-
-    # download example weather data file in case it does not yet exist
-    if not os.path.isfile(file):
-        logging.debug("Download weather data for example.")
-        req = requests.get("https://osf.io/59bqn/download")
-        with open(file, "wb") as fout:
-            fout.write(req.content)
-
-    # read csv file
-    weather_df = pd.read_csv(
-        file,
-        index_col=0,
-        header=[0, 1],
-    )
-    weather_df.index = pd.to_datetime(weather_df.index, utc=True)
-
-    # change time zone
-    weather_df.index = weather_df.index.tz_convert("Europe/Berlin")
-
-    return weather_df
-
-
 def run_example():
     r"""
     Runs the example.
 
     """
-    weather = get_weather_data("weather.csv")
+    weather = mc_e.get_weather_data("weather.csv")
     e126 = WindTurbine(
         **{
             "turbine_type": "E-126/4200",  # turbine type as in register
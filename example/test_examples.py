@@ -3,19 +3,41 @@ SPDX-FileCopyrightText: 2019 oemof developer group <contact@oemof.org>
 SPDX-License-Identifier: MIT
 """
 
+import logging
 import os
+import pandas as pd
+import pytest
 from example import modelchain_example as mc_e
 from example import turbine_cluster_modelchain_example as tc_mc_e
 from numpy.testing import assert_allclose
+from pandas.testing import assert_frame_equal, assert_series_equal
 import pytest_notebook
 
 
 class TestExamples:
+    @classmethod
+    def setup_class(cls):
+        """Read the weather data once for all tests"""
+        cls.weather = mc_e.get_weather_data("weather.csv")
+
+    def _write_weather_file(self, datapath, lines=12):
+        """
+        Writes the first `lines` lines of the example weather data file to
+        `datapath`. Returns `datapath`.
+        """
+        os.makedirs(datapath, exist_ok=True)
+        with open(os.path.join(mc_e.default_datapath, "weather.csv")) as f:
+            head = [next(f) for _ in range(lines)]
+        with open(os.path.join(datapath, "weather.csv"), "w") as f:
+            f.writelines(head)
+        return str(datapath)
+
     def test_modelchain_example_flh(self):
         # tests full load hours
-        weather = mc_e.get_weather_data("weather.csv")
         my_turbine, e126, dummy_turbine = mc_e.initialize_wind_turbines()
-        mc_e.calculate_power_output(weather, my_turbine, e126, dummy_turbine)
+        mc_e.calculate_power_output(
+            self.weather, my_turbine, e126, dummy_turbine
+        )
 
         assert_allclose(
             2730.142, (e126.power_output.sum() / e126.nominal_power), 0.01
@@ -26,9 +48,22 @@ class TestExamples:
             0.01,
         )
 
+    def test_modelchain_example_string_heights(self):
+        # weather data with heights as strings is not changed
+        weather = self.weather.copy()
+        weather.columns = weather.columns.set_levels(
+            weather.columns.levels[1].astype(str), level=1
+        )
+        columns = weather.columns
+        my_turbine, e126, dummy_turbine = mc_e.initialize_wind_turbines()
+        mc_e.calculate_power_output(weather, my_turbine, e126, dummy_turbine)
+        assert weather.columns is columns
+        assert_allclose(
+            2730.142, (e126.power_output.sum() / e126.nominal_power), 0.01
+        )
+
     def test_turbine_cluster_modelchain_example_flh(self):
         # tests full load hours
-        weather = mc_e.get_weather_data("weather.csv")
         my_turbine, e126, dummy_turbine = mc_e.initialize_wind_turbines()
         example_farm, example_farm_2 = tc_mc_e.initialize_wind_farms(
             my_turbine, e126
@@ -36,7 +71,9 @@ class TestExamples:
         example_cluster = tc_mc_e.initialize_wind_turbine_cluster(
             example_farm, example_farm_2
         )
-        tc_mc_e.calculate_power_output(weather, example_farm, example_cluster)
+        tc_mc_e.calculate_power_output(
+            self.weather, example_farm, example_cluster
+        )
         assert_allclose(
             2004.84125,
             (example_farm.power_output.sum() / example_farm.nominal_power),
@@ -51,6 +88,126 @@ class TestExamples:
             0.01,
         )
 
+    def test_modelchain_example_streaming(self):
+        # chunked weather data gives the same power output
+        e126 = mc_e.initialize_wind_turbines()[1]
+        mc = mc_e.ModelChain(e126).run_model(self.weather)
+        mc_streamed = mc_e.run_model_streaming(
+            mc_e.ModelChain(e126),
+            mc_e.get_weather_data("weather.csv", chunksize=1000),
+        )
+        assert_series_equal(mc.power_output, mc_streamed.power_output)
+
+    def test_get_weather_data_engines(self, tmp_path, monkeypatch):
+        # the weather data does not depend on the csv engine it is read with
+        pytest.importorskip("pyarrow")
+        weather = {}
+        for engine in ["c", "pyarrow"]:
+            monkeypatch.setattr(mc_e, "csv_engine", engine)
+            weather[engine] = mc_e.get_weather_data(
+                "weather.csv",
+                datapath=self._write_weather_file(tmp_path / engine),
+            )
+        assert_frame_equal(weather["c"], weather["pyarrow"])
+        weather_chunks = mc_e.get_weather_data(
+            "weather.csv", datapath=str(tmp_path / "c"), chunksize=4
+        )
+        assert_frame_equal(pd.concat(weather_chunks), weather["c"])
+
+    def test_get_weather_data_naive_time_stamps(self, tmp_path, monkeypatch):
+        # time stamps without UTC offset are read as UTC by both engines
+        datapath = self._write_weather_file(tmp_path)
+        file = os.path.join(datapath, "weather.csv")
+        with open(file) as f:
+            lines = f.read().replace("+01:00", "")
+        with open(file, "w") as f:
+            f.write(lines)
+        weather_exp = self.weather.iloc[:10].copy()
+        weather_exp.index = weather_exp.index + pd.Timedelta(hours=1)
+        for engine in ["c", "pyarrow"]:
+            if engine == "pyarrow":
+                pytest.importorskip("pyarrow")
+            monkeypatch.setattr(mc_e, "csv_engine", engine)
+            if os.path.isfile(file + ".pkl"):
+                os.remove(file + ".pkl")
+            assert_frame_equal(
+                mc_e.get_weather_data("weather.csv", datapath=datapath),
+                weather_exp,
+            )
+        weather_chunks = mc_e.get_weather_data(
+            "weather.csv", datapath=datapath, chunksize=4
+        )
+        assert_frame_equal(pd.concat(weather_chunks), weather_exp)
+
+    def test_get_weather_data_cache(self, tmp_path, monkeypatch):
+        datapath = self._write_weather_file(tmp_path)
+        file = os.path.join(datapath, "weather.csv")
+        cache = file + ".pkl"
+        weather = mc_e.get_weather_data("weather.csv", datapath=datapath)
+        assert sorted(os.listdir(datapath)) == [
+            "weather.csv",
+            "weather.csv.pkl",
+        ]
+
+        # the cached weather data is used as long as the csv file is unchanged
+        with monkeypatch.context() as m:
+            m.setattr(
+                mc_e,
+                "_format_weather_data",
+                lambda weather_df: pytest.fail("Cache was not used."),
+            )
+            assert_frame_equal(
+                mc_e.get_weather_data("weather.csv", datapath=datapath),
+                weather,
+            )
+
+        # the csv file is read again after it was replaced, even by a file
+        # that is older than the cache
+        self._write_weather_file(tmp_path, lines=6)
+        mtime = os.path.getmtime(cache) - 10
+        os.utime(file, (mtime, mtime))
+        assert_frame_equal(
+            mc_e.get_weather_data("weather.csv", datapath=datapath),
+            weather.iloc[:4],
+        )
+
+        # the csv file is read again if the format of the data changed
+        monkeypatch.setattr(
+            mc_e, "weather_cache_version", mc_e.weather_cache_version + 1
+        )
+        with monkeypatch.context() as m:
+            m.setattr(mc_e, "weather_tz", mc_e.ZoneInfo("UTC"))
+            weather_utc = mc_e.get_weather_data(
+                "weather.csv", datapath=datapath
+            )
+        assert str(weather_utc.index.tz) == "UTC"
+
+        # a corrupt cache is replaced by the data read from the csv file
+        with open(cache, "wb") as f:
+            f.write(b"\x80\x04corrupt")
+        assert_frame_equal(
+            mc_e.get_weather_data("weather.csv", datapath=datapath),
+            weather.iloc[:4],
+        )
+        assert_frame_equal(pd.read_pickle(cache)["weather"], weather.iloc[:4])
+
+    def test_show_plot(self, tmp_path, monkeypatch, caplog):
+        # without a window the figure is saved to the working directory
+        plt = pytest.importorskip("matplotlib.pyplot")
+        plt.switch_backend("Agg")
+        monkeypatch.chdir(tmp_path)
+        caplog.set_level(logging.INFO)
+        plt.figure()
+        mc_e.show_plot("plot.png")
+        assert os.path.isfile(tmp_path / "plot.png")
+        assert str(tmp_path / "plot.png") in caplog.text
+
+        # a figure that cannot be saved is logged
+        plt.figure()
+        mc_e.show_plot("plot.png", path=str(tmp_path / "not_existent"))
+        assert "Figure could not be saved" in caplog.text
+        assert plt.get_fignums() == []
+
     def _notebook_run(self, path):
         """
         Execute a notebook and collect output.
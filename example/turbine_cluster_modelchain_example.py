@@ -12,11 +12,6 @@ SPDX-License-Identifier: MIT
 """
 import pandas as pd
 
-try:
-    from matplotlib import pyplot as plt
-except ImportError:
-    plt = None
-
 from example import modelchain_example as mc_e
 from windpowerlib import WindFarm
 from windpowerlib import WindTurbineCluster
@@ -200,14 +195,20 @@ def plot_or_print(example_farm, example_cluster):
         WindTurbineCluster object.
 
     """
+    plt = mc_e.get_pyplot()
 
     # plot or print power output
     if plt:
-        example_cluster.power_output.plot(legend=True, label="example cluster")
-        example_farm.power_output.plot(legend=True, label="example farm")
-        plt.xlabel("Wind speed in m/s")
+        pd.DataFrame(
+            {
+                "example cluster": example_cluster.power_output,
+                "example farm": example_farm.power_output,
+            }
+        ).plot()
+        plt.xlabel("Time")
         plt.ylabel("Power in W")
-        plt.show()
+        plt.tight_layout()
+        mc_e.show_plot("cluster_power_output.png")
     else:
         print(example_cluster.power_output)
         print(example_farm.power_output)
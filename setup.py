@@ -25,13 +25,14 @@ setup(
     long_description=read("README.rst"),
     long_description_content_type="text/x-rst",
     zip_safe=False,
-    install_requires=["pandas", "requests"],
+    python_requires=">=3.9",
+    install_requires=["numpy", "pandas", "requests"],
     extras_require={
         "dev": [
             "jupyter",
             "matplotlib",
             "nbsphinx",
-            "numpy",
+            "pyarrow",
             "pytest",
             "pytest-notebook",
             "sphinx >= 1.4",
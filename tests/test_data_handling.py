@@ -14,6 +14,7 @@ import requests
 from windpowerlib.data import (
     check_data_integrity,
     check_turbine_data,
+    check_weather_data,
     get_turbine_types,
     restore_default_turbine_data,
     store_turbine_data_from_oedb,
@@ -37,7 +38,6 @@ class TestDataCheck:
 
     @classmethod
     def teardown_class(cls):
-        cls.path = os.path.join(os.path.dirname(__file__), "oedb")
         for f in os.listdir(cls.path):
             if "error" in f or "backup" in f or "tmp" in f:
                 os.remove(os.path.join(cls.path, f))
@@ -49,9 +49,12 @@ class TestDataCheck:
 
     def test_data_check_logging_warnings(self, caplog):
         """Check logging warnings about the checked data."""
-        self.df.loc["GE158/4800", "has_power_curve"] = True
-        self.df.loc["GE100/2750", "has_cp_curve"] = True
-        self.df.to_csv(self.tmp_fn.format("turbine_data"))
+        # alter a copy, so that the data read once in setup_class stays
+        # unchanged for the other tests
+        df = self.df.copy()
+        df.loc["GE158/4800", "has_power_curve"] = True
+        df.loc["GE100/2750", "has_cp_curve"] = True
+        df.to_csv(self.tmp_fn.format("turbine_data"))
         check_data_integrity(self.tmp_fn, min_pc_length=26)
         assert "E48/800: power_curve is too short (25 values)" in caplog.text
         assert "GE158/4800: No power curve" in caplog.text
@@ -77,6 +80,7 @@ class TestDataCheck:
             check_turbine_data(self.orig_fn)
         copyfile(self.backup_fn.format(name), self.orig_fn.format(name))
 
+    @pytest.mark.network
     def test_get_turbine_types(self, capsys):
         """Test the `get_turbine_types` function."""
         get_turbine_types(turbine_library="oedb")
@@ -87,6 +91,7 @@ class TestDataCheck:
         with pytest.raises(ValueError, match=msg):
             get_turbine_types("wrong")
 
+    @pytest.mark.network
     def test_store_turbine_data_from_oedb(self, caplog):
         """Test `store_turbine_data_from_oedb` function."""
         t = {}
@@ -145,6 +150,7 @@ class TestDataCheck:
         assert turbine_data.at[1, "has_cp_curve"]
         assert turbine_data.at[0, "has_power_curve"]
 
+    @pytest.mark.network
     def test_wrong_url_load_turbine_data(self):
         """Load turbine data from oedb with a wrong schema."""
         with pytest.raises(
@@ -191,3 +197,21 @@ class TestDataCheck:
                 default_path, os.path.basename(self.orig_fn.format(name))
             )
             assert filecmp.cmp(file, default_file)
+
+    def test_check_weather_data_heights(self):
+        """Data heights given as strings are converted to numeric values."""
+        weather_df = pd.DataFrame(
+            [[5.0, 0.15], [6.0, 0.15]],
+            columns=[["wind_speed", "roughness_length"], ["10", "0"]],
+        )
+        weather_df = check_weather_data(weather_df)
+        heights = weather_df.columns.get_level_values(1)
+        assert pd.api.types.is_numeric_dtype(heights)
+        assert list(heights) == [10, 0]
+        # numeric heights are kept and the columns are not rebuilt
+        columns = weather_df.columns
+        weather_df = check_weather_data(weather_df)
+        heights = weather_df.columns.get_level_values(1)
+        assert pd.api.types.is_numeric_dtype(heights)
+        assert list(heights) == [10, 0]
+        assert weather_df.columns is columns
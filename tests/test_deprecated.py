@@ -15,6 +15,7 @@ def test_old_import():
         get_turbine_types()
 
 
+@pytest.mark.network
 def test_old_name_load_data_from_oedb(recwarn):
     load_turbine_data_from_oedb()
     assert recwarn.pop(FutureWarning)
@@ -26,22 +26,13 @@ class TestModelChain:
             ),
         }
 
-        temperature_2m = np.array([[267], [268]])
-        temperature_10m = np.array([[267], [266]])
-        pressure_0m = np.array([[101125], [101000]])
-        wind_speed_8m = np.array([[4.0], [5.0]])
-        wind_speed_10m = np.array([[5.0], [6.5]])
-        roughness_length = np.array([[0.15], [0.15]])
         cls.weather_df = pd.DataFrame(
-            np.hstack(
-                (
-                    temperature_2m,
-                    temperature_10m,
-                    pressure_0m,
-                    wind_speed_8m,
-                    wind_speed_10m,
-                    roughness_length,
-                )
+            np.array(
+                [
+                    [267, 267, 101125, 4.0, 5.0, 0.15],
+                    [268, 266, 101000, 5.0, 6.5, 0.15],
+                ],
+                dtype=np.float64,
             ),
             index=[0, 1],
             columns=[
@@ -69,10 +60,8 @@ class TestModelChain:
         )
 
         # Parameters for tests
-        temperature_2m = np.array([[267], [268]])
-        temperature_10m = np.array([[267], [266]])
         weather_df = pd.DataFrame(
-            np.hstack((temperature_2m, temperature_10m)),
+            np.array([[267, 267], [268, 266]]),
             index=[0, 1],
             columns=[
                 np.array(["temperature", "temperature"]),
@@ -122,11 +111,8 @@ class TestModelChain:
         )
 
         # Parameters for tests
-        temperature_2m = np.array([[267], [268]])
-        temperature_10m = np.array([[267], [266]])
-        pressure_0m = np.array([[101125], [101000]])
         weather_df = pd.DataFrame(
-            np.hstack((temperature_2m, temperature_10m, pressure_0m)),
+            np.array([[267, 267, 101125], [268, 266, 101000]]),
             index=[0, 1],
             columns=[
                 np.array(["temperature", "temperature", "pressure"]),
@@ -159,10 +145,8 @@ class TestModelChain:
         assert_series_equal(test_mc.density_hub(weather_df), rho_exp)
 
         # density interpolation
-        density_10m = np.array([[1.30591], [1.29940]])
-        density_150m = np.array([[1.30305], [1.29657]])
         weather_df = pd.DataFrame(
-            np.hstack((density_10m, density_150m)),
+            np.array([[1.30591, 1.30305], [1.29940, 1.29657]]),
             index=[0, 1],
             columns=[np.array(["density", "density"]), np.array([10, 150])],
         )
@@ -189,11 +173,8 @@ class TestModelChain:
         )
 
         # Parameters for tests
-        wind_speed_8m = np.array([[4.0], [5.0]])
-        wind_speed_10m = np.array([[5.0], [6.5]])
-        roughness_length = np.array([[0.15], [0.15]])
         weather_df = pd.DataFrame(
-            np.hstack((wind_speed_8m, wind_speed_10m, roughness_length)),
+            np.array([[4.0, 5.0, 0.15], [5.0, 6.5, 0.15]]),
             index=[0, 1],
             columns=[
                 np.array(["wind_speed", "wind_speed", "roughness_length"]),
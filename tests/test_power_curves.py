@@ -87,6 +87,31 @@ class TestPowerCurves:
             parameters["standard_deviation_method"] = "misspelled"
             smooth_power_curve(**parameters)
 
+    def test_smooth_power_curve_with_arrays(self):
+        """Power curve given as np.array gives the same smoothed curve"""
+        test_curve = wt.WindTurbine(**self.test_turbine).power_curve
+        smoothed_curve_exp = smooth_power_curve(
+            test_curve["wind_speed"],
+            test_curve["value"],
+            standard_deviation_method="Staffell_Pfenninger",
+        )
+        assert_frame_equal(
+            smooth_power_curve(
+                test_curve["wind_speed"].to_numpy(),
+                test_curve["value"].to_numpy(),
+                standard_deviation_method="Staffell_Pfenninger",
+            ),
+            smoothed_curve_exp,
+        )
+        # Smoothed power curve values are zero for a standard deviation of
+        # zero
+        smoothed_curve = smooth_power_curve(
+            test_curve["wind_speed"],
+            test_curve["value"],
+            turbulence_intensity=0.0,
+        )
+        assert (smoothed_curve["value"] == 0.0).all()
+
     def test_wake_losses_to_power_curve(self):
         test_curve = wt.WindTurbine(**self.test_turbine).power_curve
         parameters = {
@@ -275,6 +275,40 @@ class TestPowerOutput:
             parameters["density"] = None
             power_curve_density_correction(**parameters)
 
+    def test_power_curve_density_correction_interpolation(self):
+        """Results equal np.interp applied to the power curve of each step"""
+        power_curve_wind_speeds = np.array([3.0, 5.0, 10.0, 15.0, 25.0])
+        power_curve_values = np.array([0.0, 180.0, 1500.0, 3000.0, 3000.0])
+        wind_speed = np.array(
+            [0.0, 3.0, 4.2, 9.0, 14.0, 25.0, 30.0, np.nan, 0.0, 9.0, 30.0]
+        )
+        density = np.array(
+            [1.3, 1.225, 1.1, 1.3, 1.0, 1.225, 1.2, 1.2]
+            + [np.nan, np.nan, np.nan]
+        )
+        exponent = np.interp(
+            power_curve_wind_speeds, [7.5, 12.5], [1 / 3, 2 / 3]
+        )
+        power_output_exp = [
+            np.interp(
+                v,
+                (1.225 / rho) ** exponent * power_curve_wind_speeds,
+                power_curve_values,
+                left=0,
+                right=0,
+            )
+            for v, rho in zip(wind_speed, density)
+        ]
+        assert_allclose(
+            power_curve_density_correction(
+                wind_speed,
+                power_curve_wind_speeds,
+                power_curve_values,
+                density,
+            ),
+            power_output_exp,
+        )
+
     def test_wrong_spelling_density_correction(self):
         parameters = {
             "wind_speed": pd.Series(data=[2.0, 5.5, 7.0]),
@@ -17,22 +17,13 @@ import windpowerlib.turbine_cluster_modelchain as tc_mc
 class TestTurbineClusterModelChain:
     @classmethod
     def setup_class(self):
-        temperature_2m = np.array([[267], [268]])
-        temperature_10m = np.array([[267], [266]])
-        pressure_0m = np.array([[101125], [101000]])
-        wind_speed_8m = np.array([[4.0], [5.0]])
-        wind_speed_10m = np.array([[5.0], [6.5]])
-        roughness_length = np.array([[0.15], [0.15]])
         self.weather_df = pd.DataFrame(
-            np.hstack(
-                (
-                    temperature_2m,
-                    temperature_10m,
-                    pressure_0m,
-                    wind_speed_8m,
-                    wind_speed_10m,
-                    roughness_length,
-                )
+            np.array(
+                [
+                    [267, 267, 101125, 4.0, 5.0, 0.15],
+                    [268, 266, 101000, 5.0, 6.5, 0.15],
+                ],
+                dtype=np.float64,
             ),
             index=[0, 1],
             columns=[
@@ -299,6 +290,22 @@ class TestTurbineClusterModelChain:
         )
         test_tc_mc.run_model(self.weather_df)
 
+    def test_cluster_with_same_farm_twice(self):
+        """A farm added twice to a cluster counts twice."""
+        farm = wf.WindFarm(**self.test_farm_2)
+        power_output_farm = (
+            tc_mc.TurbineClusterModelChain(farm, wake_losses_model=None)
+            .run_model(self.weather_df)
+            .power_output
+        )
+        cluster = wtc.WindTurbineCluster(wind_farms=[farm, farm])
+        power_output_cluster = (
+            tc_mc.TurbineClusterModelChain(cluster, wake_losses_model=None)
+            .run_model(self.weather_df)
+            .power_output
+        )
+        assert_series_equal(power_output_cluster, 2 * power_output_farm)
+
     def test_wind_turbine_cluster_repr_with_name(self):
         """Test string representation of WindTurbineCluster with a name."""
         assert "Wind turbine cluster:" in repr(
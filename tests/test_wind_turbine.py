@@ -7,6 +7,8 @@ SPDX-License-Identifier: MIT
 
 import os
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from windpowerlib.tools import WindpowerlibUserWarning
@@ -38,6 +40,16 @@ class TestWindTurbine:
         with pytest.raises(FileNotFoundError):
             get_turbine_data_from_file(turbine_type="...", path="not_existent")
 
+    def test_changed_power_curve_file(self, tmp_path):
+        """A changed turbine data file is read again."""
+        fn = os.path.join(tmp_path, "power_curves.csv")
+        with open(fn, "w") as f:
+            f.write("turbine_type,1.0,2.0\nT1,10.0,20.0\n")
+        assert get_turbine_data_from_file("T1", fn)["value"].max() == 20.0
+        with open(fn, "w") as f:
+            f.write("turbine_type,1.0,2.0,3.0\nT1,10.0,20.0,30.0\n")
+        assert get_turbine_data_from_file("T1", fn)["value"].max() == 30.0
+
     @pytest.mark.filterwarnings("ignore:The WindTurbine")
     def test_string_representation_of_wind_turbine(self):
         assert "Wind turbine: ['hub height=120 m'" in repr(WindTurbine(120))
@@ -65,6 +77,16 @@ class TestWindTurbine:
         with pytest.raises(TypeError):
             WindTurbine(**test_turbine_data)
 
+    def test_power_curve_as_structured_array(self):
+        """Power curve given as numpy structured array."""
+        power_curve = np.array(
+            [(0.0, 0.0), (5.0, 180e3), (15.0, 3e6)],
+            dtype=[("wind_speed", "f8"), ("value", "f8")],
+        )
+        wt = WindTurbine(hub_height=100, power_curve=power_curve)
+        assert isinstance(wt.power_curve, pd.DataFrame)
+        assert list(wt.power_curve["value"]) == [0.0, 180e3, 3e6]
+
     def test_to_group_method(self):
         example_turbine = {
             "hub_height": 100,
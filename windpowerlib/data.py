@@ -13,7 +13,7 @@ from shutil import copyfile
 import pandas as pd
 import requests
 from windpowerlib.tools import WindpowerlibUserWarning
-from windpowerlib.wind_turbine import WindTurbine
+from windpowerlib.wind_turbine import WindTurbine, _read_turbine_data_file
 
 
 def get_turbine_types(turbine_library="local", print_out=True, filter_=True):
@@ -82,7 +82,11 @@ def get_turbine_types(turbine_library="local", print_out=True, filter_=True):
         filename = os.path.join(
             os.path.dirname(__file__), "oedb", "turbine_data.csv"
         )
-        df = pd.read_csv(filename, index_col=0).reset_index()
+        stat = os.stat(filename)
+        # the file is parsed only once, as for the initialisation of turbines
+        df = _read_turbine_data_file(
+            filename, stat.st_mtime_ns, stat.st_size
+        ).reset_index()
     elif turbine_library == "oedb":
         df = fetch_turbine_data_from_oedb()
 
@@ -340,6 +344,8 @@ def _process_and_save_oedb_data(turbine_data, threshold=0.2):
         turbine_data_df["nominal_power"] *= 1000
         turbine_data_df.sort_index(inplace=True)
         turbine_data_df.to_csv(filename.format("turbine_data"))
+        # do not rely on the modification time to detect the new files
+        _read_turbine_data_file.cache_clear()
     return turbine_data
 
 
@@ -406,6 +412,7 @@ def restore_default_turbine_data():
         src = os.path.join(src_path, file)
         dst = os.path.join(dst_path, file)
         copyfile(src, dst)
+    _read_turbine_data_file.cache_clear()
 
 
 def check_weather_data(weather_data):
@@ -426,16 +433,21 @@ def check_weather_data(weather_data):
 
     """
     # Convert data heights to integer. In some case they are strings.
-    weather_data.columns = pd.MultiIndex.from_arrays(
-        [
-            weather_data.columns.get_level_values(0),
-            pd.to_numeric(weather_data.columns.get_level_values(1)),
-        ]
-    )
+    # The columns are only rebuilt if necessary, as the same weather table is
+    # usually passed to the model chains of several power plants.
+    heights = weather_data.columns.get_level_values(1)
+    if not pd.api.types.is_numeric_dtype(heights):
+        weather_data.columns = pd.MultiIndex.from_arrays(
+            [
+                weather_data.columns.get_level_values(0),
+                pd.to_numeric(heights),
+            ]
+        )
 
     # check for nan values
-    if weather_data.isnull().any().any():
-        nan_columns = list(weather_data.columns[weather_data.isnull().any()])
+    nan_values = weather_data.isnull().any()
+    if nan_values.any():
+        nan_columns = list(weather_data.columns[nan_values])
         msg = (
             "The following columns of the weather data contain invalid "
             "values like 'nan': {0}"
@@ -7,6 +7,7 @@ SPDX-FileCopyrightText: 2019 oemof developer group <contact@oemof.org>
 SPDX-License-Identifier: MIT
 """
 import logging
+import numpy as np
 from windpowerlib import (
     wind_speed,
     density,
@@ -17,6 +18,27 @@ from windpowerlib import (
 )
 
 
+def _closest_height(heights, hub_height):
+    r"""
+    Returns the height closest to the hub height.
+
+    Parameters
+    ----------
+    heights : :pandas:`pandas.Index<index>`
+        Heights at which weather data is available, e.g. the columns of
+        `weather_df['wind_speed']`.
+    hub_height : float
+        Hub height of the power plant in m.
+
+    Returns
+    -------
+    Element of `heights` closest to `hub_height`. If two heights are equally
+    close, the first one is returned.
+
+    """
+    return heights[np.abs(np.asarray(heights) - hub_height).argmin()]
+
+
 class ModelChain(object):
     r"""Model to determine the output of a wind turbine
 
@@ -192,25 +214,20 @@ class ModelChain(object):
         temperature(s) closest to the hub height are used.
 
         """
-        if self.power_plant.hub_height in weather_df["temperature"]:
-            temperature_hub = weather_df["temperature"][
-                self.power_plant.hub_height
-            ]
+        # select the temperatures once, as every selection from the
+        # MultiIndex columns copies the data
+        temperatures = weather_df["temperature"]
+        if self.power_plant.hub_height in temperatures:
+            temperature_hub = temperatures[self.power_plant.hub_height]
         elif self.temperature_model == "linear_gradient":
             logging.debug(
                 "Calculating temperature using temperature " "gradient."
             )
-            closest_height = weather_df["temperature"].columns[
-                min(
-                    range(len(weather_df["temperature"].columns)),
-                    key=lambda i: abs(
-                        weather_df["temperature"].columns[i]
-                        - self.power_plant.hub_height
-                    ),
-                )
-            ]
+            closest_height = _closest_height(
+                temperatures.columns, self.power_plant.hub_height
+            )
             temperature_hub = temperature.linear_gradient(
-                weather_df["temperature"][closest_height],
+                temperatures[closest_height],
                 closest_height,
                 self.power_plant.hub_height,
             )
@@ -220,7 +237,7 @@ class ModelChain(object):
                 "extrapolation."
             )
             temperature_hub = tools.linear_interpolation_extrapolation(
-                weather_df["temperature"], self.power_plant.hub_height
+                temperatures, self.power_plant.hub_height
             )
         else:
             raise ValueError(
@@ -273,34 +290,24 @@ class ModelChain(object):
             logging.debug(
                 "Calculating density using barometric height " "equation."
             )
-            closest_height = weather_df["pressure"].columns[
-                min(
-                    range(len(weather_df["pressure"].columns)),
-                    key=lambda i: abs(
-                        weather_df["pressure"].columns[i]
-                        - self.power_plant.hub_height
-                    ),
-                )
-            ]
+            pressures = weather_df["pressure"]
+            closest_height = _closest_height(
+                pressures.columns, self.power_plant.hub_height
+            )
             density_hub = density.barometric(
-                weather_df["pressure"][closest_height],
+                pressures[closest_height],
                 closest_height,
                 self.power_plant.hub_height,
                 temperature_hub,
             )
         elif self.density_model == "ideal_gas":
             logging.debug("Calculating density using ideal gas equation.")
-            closest_height = weather_df["pressure"].columns[
-                min(
-                    range(len(weather_df["pressure"].columns)),
-                    key=lambda i: abs(
-                        weather_df["pressure"].columns[i]
-                        - self.power_plant.hub_height
-                    ),
-                )
-            ]
+            pressures = weather_df["pressure"]
+            closest_height = _closest_height(
+                pressures.columns, self.power_plant.hub_height
+            )
             density_hub = density.ideal_gas(
-                weather_df["pressure"][closest_height],
+                pressures[closest_height],
                 closest_height,
                 self.power_plant.hub_height,
                 temperature_hub,
@@ -350,25 +357,20 @@ class ModelChain(object):
         wind speed(s) closest to the hub height are used.
 
         """
-        if self.power_plant.hub_height in weather_df["wind_speed"]:
-            wind_speed_hub = weather_df["wind_speed"][
-                self.power_plant.hub_height
-            ]
+        # select the wind speeds once, as every selection from the
+        # MultiIndex columns copies the data
+        wind_speeds = weather_df["wind_speed"]
+        if self.power_plant.hub_height in wind_speeds:
+            wind_speed_hub = wind_speeds[self.power_plant.hub_height]
         elif self.wind_speed_model == "logarithmic":
             logging.debug(
                 "Calculating wind speed using logarithmic wind " "profile."
             )
-            closest_height = weather_df["wind_speed"].columns[
-                min(
-                    range(len(weather_df["wind_speed"].columns)),
-                    key=lambda i: abs(
-                        weather_df["wind_speed"].columns[i]
-                        - self.power_plant.hub_height
-                    ),
-                )
-            ]
+            closest_height = _closest_height(
+                wind_speeds.columns, self.power_plant.hub_height
+            )
             wind_speed_hub = wind_speed.logarithmic_profile(
-                weather_df["wind_speed"][closest_height],
+                wind_speeds[closest_height],
                 closest_height,
                 self.power_plant.hub_height,
                 weather_df["roughness_length"].iloc[:, 0],
@@ -376,17 +378,11 @@ class ModelChain(object):
             )
         elif self.wind_speed_model == "hellman":
             logging.debug("Calculating wind speed using hellman equation.")
-            closest_height = weather_df["wind_speed"].columns[
-                min(
-                    range(len(weather_df["wind_speed"].columns)),
-                    key=lambda i: abs(
-                        weather_df["wind_speed"].columns[i]
-                        - self.power_plant.hub_height
-                    ),
-                )
-            ]
+            closest_height = _closest_height(
+                wind_speeds.columns, self.power_plant.hub_height
+            )
             wind_speed_hub = wind_speed.hellman(
-                weather_df["wind_speed"][closest_height],
+                wind_speeds[closest_height],
                 closest_height,
                 self.power_plant.hub_height,
                 weather_df["roughness_length"].iloc[:, 0],
@@ -398,7 +394,7 @@ class ModelChain(object):
                 "extrapolation."
             )
             wind_speed_hub = tools.linear_interpolation_extrapolation(
-                weather_df["wind_speed"], self.power_plant.hub_height
+                wind_speeds, self.power_plant.hub_height
             )
         elif self.wind_speed_model == "log_interpolation_extrapolation":
             logging.debug(
@@ -406,7 +402,7 @@ class ModelChain(object):
                 "extrapolation."
             )
             wind_speed_hub = tools.logarithmic_interpolation_extrapolation(
-                weather_df["wind_speed"], self.power_plant.hub_height
+                wind_speeds, self.power_plant.hub_height
             )
         else:
             raise ValueError(
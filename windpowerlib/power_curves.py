@@ -135,80 +135,63 @@ def smooth_power_curve(
             + "options are 'turbulence_intensity', or "
             + "'Staffell_Pfenninger'".format(standard_deviation_method)
         )
-    # Initialize list for power curve values
-    smoothed_power_curve_values = []
+    power_curve_wind_speeds = np.asarray(power_curve_wind_speeds)
+    power_curve_values = np.asarray(power_curve_values)
     # Append wind speeds to `power_curve_wind_speeds`
-    maximum_value = power_curve_wind_speeds.iloc[-1] + wind_speed_range
-    while power_curve_wind_speeds.values[-1] < maximum_value:
-        power_curve_wind_speeds = pd.concat(
-            [
-                power_curve_wind_speeds,
-                pd.Series(
-                    power_curve_wind_speeds.iloc[-1]
-                    + (
-                        power_curve_wind_speeds.iloc[5]
-                        - power_curve_wind_speeds.iloc[4]
-                    ),
-                    index=[power_curve_wind_speeds.index[-1] + 1],
-                )
-            ],
-            sort=True,
+    wind_speed_step = power_curve_wind_speeds[5] - power_curve_wind_speeds[4]
+    maximum_value = power_curve_wind_speeds[-1] + wind_speed_range
+    appended_wind_speeds = []
+    last_wind_speed = power_curve_wind_speeds[-1]
+    while last_wind_speed < maximum_value:
+        last_wind_speed = last_wind_speed + wind_speed_step
+        appended_wind_speeds.append(last_wind_speed)
+    power_curve_wind_speeds = np.append(
+        power_curve_wind_speeds, appended_wind_speeds
+    )
+    power_curve_values = np.append(
+        power_curve_values, np.zeros(len(appended_wind_speeds))
+    )
+    # Create array of wind speeds for the sum with one row per power curve
+    # wind speed
+    wind_speeds_block = (
+        np.arange(
+            -wind_speed_range, wind_speed_range + block_width, block_width
         )
-        power_curve_values = pd.concat(
-            [
+        + power_curve_wind_speeds[:, np.newaxis]
+    )
+    # Get standard deviation for Gauss function
+    standard_deviations = (
+        (power_curve_wind_speeds * normalized_standard_deviation + 0.6)
+        if standard_deviation_method == "Staffell_Pfenninger"
+        else power_curve_wind_speeds * normalized_standard_deviation
+    )[:, np.newaxis]
+    # The gaussian distribution is not defined for a standard deviation
+    # of zero. Smoothed power curve values are set to zero in this case.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        smoothed_power_curve_values = np.sum(
+            block_width
+            * np.interp(
+                wind_speeds_block,
+                power_curve_wind_speeds,
                 power_curve_values,
-                pd.Series(0.0, index=[power_curve_values.index[-1] + 1])
-            ],
-            sort=True,
-        )
-    for power_curve_wind_speed in power_curve_wind_speeds:
-        # Create array of wind speeds for the sum
-        wind_speeds_block = (
-            np.arange(
-                -wind_speed_range, wind_speed_range + block_width, block_width
+                left=0,
+                right=0,
             )
-            + power_curve_wind_speed
-        )
-        # Get standard deviation for Gauss function
-        standard_deviation = (
-            (power_curve_wind_speed * normalized_standard_deviation + 0.6)
-            if standard_deviation_method == "Staffell_Pfenninger"
-            else power_curve_wind_speed * normalized_standard_deviation
+            * tools.gauss_distribution(
+                power_curve_wind_speeds[:, np.newaxis] - wind_speeds_block,
+                standard_deviations,
+                mean_gauss,
+            ),
+            axis=1,
         )
-        # Get the smoothed value of the power output
-        if standard_deviation == 0.0:
-            # The gaussian distribution is not defined for a standard deviation
-            # of zero. Smoothed power curve value is set to zero.
-            smoothed_value = 0.0
-        else:
-            smoothed_value = sum(
-                block_width
-                * np.interp(
-                    wind_speed,
-                    power_curve_wind_speeds,
-                    power_curve_values,
-                    left=0,
-                    right=0,
-                )
-                * tools.gauss_distribution(
-                    power_curve_wind_speed - wind_speed,
-                    standard_deviation,
-                    mean_gauss,
-                )
-                for wind_speed in wind_speeds_block
-            )
-        # Add value to list - add zero if `smoothed_value` is nan as Gauss
-        # distribution for a standard deviation of zero.
-        smoothed_power_curve_values.append(smoothed_value)
+    smoothed_power_curve_values[standard_deviations[:, 0] == 0.0] = 0.0
     # Create smoothed power curve data frame
     smoothed_power_curve_df = pd.DataFrame(
-        data=[
-            list(power_curve_wind_speeds.values),
-            smoothed_power_curve_values,
-        ]
-    ).transpose()
-    # Rename columns of the data frame
-    smoothed_power_curve_df.columns = ["wind_speed", "value"]
+        {
+            "wind_speed": power_curve_wind_speeds,
+            "value": smoothed_power_curve_values,
+        }
+    )
     return smoothed_power_curve_df
 
 
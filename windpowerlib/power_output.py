@@ -67,20 +67,23 @@ def power_coefficient_curve(
             Wirtschaftlichkeit". 4. Auflage, Springer-Verlag, 2008, p. 542
 
     """
+    # np.interp and the arithmetic below are considerably faster on numpy
+    # arrays than on pd.Series, therefore the input is converted beforehand
+    wind_speed_values = np.asarray(wind_speed)
     power_coefficient_time_series = np.interp(
-        wind_speed,
-        power_coefficient_curve_wind_speeds,
-        power_coefficient_curve_values,
+        wind_speed_values,
+        np.asarray(power_coefficient_curve_wind_speeds),
+        np.asarray(power_coefficient_curve_values),
         left=0,
         right=0,
     )
     power_output = (
         1
         / 8
-        * density
+        * np.asarray(density)
         * rotor_diameter ** 2
         * np.pi
-        * np.power(wind_speed, 3)
+        * np.power(wind_speed_values, 3)
         * power_coefficient_time_series
     )
     # Power_output as pd.Series if wind_speed is pd.Series (else: np.array)
@@ -142,10 +145,11 @@ def power_curve(
 
     """
     if density_correction is False:
+        # np.interp is considerably faster on numpy arrays than on pd.Series
         power_output = np.interp(
-            wind_speed,
-            power_curve_wind_speeds,
-            power_curve_values,
+            np.asarray(wind_speed),
+            np.asarray(power_curve_wind_speeds),
+            np.asarray(power_curve_values),
             left=0,
             right=0,
         )
@@ -304,15 +308,30 @@ def _get_power_output(
         ** np.interp(power_curve_wind_speeds, [7.5, 12.5], [1 / 3, 2 / 3])
     ) * power_curve_wind_speeds
 
-    # Create the interpolation function
-    def interp_func(w_speed, p_curves):
-        return np.interp(
-            w_speed, p_curves, power_curve_values, left=0, right=0
-        )
-
-    # Calculate the power output by mapping the arrays to the interp function
-    power_output = np.array(
-        list(map(interp_func, wind_speed, power_curves_per_ts))
-    )
+    # Interpolate all timesteps at once with the same rules as np.interp
+    # instead of calling np.interp for the power curve of each timestep
+    wind_speed = np.asarray(wind_speed, dtype=float).reshape(-1, 1)
+    # index of the last power curve wind speed not above the wind speed
+    index = np.count_nonzero(power_curves_per_ts <= wind_speed, axis=1) - 1
+    lower = np.clip(index, 0, power_curve_values.size - 2).reshape(-1, 1)
+    x_lower = np.take_along_axis(power_curves_per_ts, lower, axis=1)
+    x_upper = np.take_along_axis(power_curves_per_ts, lower + 1, axis=1)
+    y_lower = power_curve_values[lower]
+    y_upper = power_curve_values[lower + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (y_upper - y_lower) / (x_upper - x_lower)
+        power_output = slope * (wind_speed - x_lower) + y_lower
+    wind_speed = wind_speed[:, 0]
+    power_output = power_output[:, 0]
+
+    # Power output is zero outside of the power curve (left=0, right=0),
+    # except for the highest power curve wind speed
+    power_output[(index < 0) | (index >= power_curve_values.size - 1)] = 0
+    at_last_value = wind_speed == power_curves_per_ts[:, -1]
+    power_output[at_last_value] = power_curve_values[-1]
+    # as with np.interp, the power output is nan for a nan wind speed or a nan
+    # density
+    power_output[np.isnan(wind_speed)] = np.nan
+    power_output[np.isnan(power_curves_per_ts).any(axis=1)] = np.nan
 
     return power_output
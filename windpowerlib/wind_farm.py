@@ -365,8 +365,8 @@ class WindFarm(object):
                     + "each wind turbine needs a power curve "
                     + "but `power_curve` of '{}' is None.".format(turbine)
                 )
-        # Initialize data frame for power curve values
-        df = pd.DataFrame()
+        # Initialize list for the power curves of the turbine types
+        turbine_power_curves = []
         for ix, row in self.wind_turbine_fleet.iterrows():
             # Check if needed parameters are available and/or assign them
             if smoothing:
@@ -407,47 +407,26 @@ class WindFarm(object):
             else:
                 # Add value zero to start and end of curve as otherwise
                 # problems can occur during the aggregation
-                if power_curve.iloc[0]["wind_speed"] != 0.0:
-                    power_curve = pd.concat(
-                        [
-                            pd.DataFrame(
-                                data={"value": [0.0], "wind_speed": [0.0]}
-                            ),
-                            power_curve,
-                        ],
-                        join="inner",
-                    )
-                if power_curve.iloc[-1]["value"] != 0.0:
-                    power_curve = pd.concat(
-                        [
-                            power_curve,
-                            pd.DataFrame(
-                                data={
-                                    "wind_speed": [
-                                        power_curve["wind_speed"].loc[
-                                            power_curve.index[-1]
-                                        ]
-                                        + 0.5
-                                    ],
-                                    "value": [0.0],
-                                }
-                            ),
-                        ],
-                        join="inner",
-                    )
-            # Add power curves of all turbine types to data frame
-            # (multiplied by turbine amount)
-            df = pd.concat(
-                [
-                    df,
-                    pd.DataFrame(
-                        power_curve.set_index(["wind_speed"])
-                        * row["number_of_turbines"]
-                    ),
-                ],
-                axis=1,
-                sort=True,
+                wind_speeds = power_curve["wind_speed"].to_numpy()
+                values = power_curve["value"].to_numpy()
+                if wind_speeds[0] != 0.0:
+                    wind_speeds = np.concatenate([[0.0], wind_speeds])
+                    values = np.concatenate([[0.0], values])
+                if values[-1] != 0.0:
+                    wind_speeds = np.append(wind_speeds, wind_speeds[-1] + 0.5)
+                    values = np.append(values, 0.0)
+                power_curve = pd.DataFrame(
+                    data={"wind_speed": wind_speeds, "value": values}
+                )
+            # Add power curve of the turbine type to list (multiplied by
+            # turbine amount)
+            turbine_power_curves.append(
+                power_curve.set_index(["wind_speed"])
+                * row["number_of_turbines"]
             )
+        # Combine the power curves of all turbine types in one data frame
+        # at once instead of growing it for every turbine type
+        df = pd.concat(turbine_power_curves, axis=1, sort=True)
         # Aggregate all power curves
         wind_farm_power_curve = pd.DataFrame(
             df.interpolate(method="index").sum(axis=1)
@@ -89,11 +89,14 @@ def logarithmic_profile(
     ):
         roughness_length = np.array(roughness_length)
 
+    # log(h / z0) = log(h) - log(z0) needs only one log per time step
+    log_roughness_length = np.log(roughness_length)
     return (
         wind_speed
-        * np.log((hub_height - 0.7 * obstacle_height) / roughness_length)
-        / np.log(
-            (wind_speed_height - 0.7 * obstacle_height) / roughness_length
+        * (np.log(hub_height - 0.7 * obstacle_height) - log_roughness_length)
+        / (
+            np.log(wind_speed_height - 0.7 * obstacle_height)
+            - log_roughness_length
         )
     )
 
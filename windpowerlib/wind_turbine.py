@@ -6,10 +6,12 @@ wind turbine.
 SPDX-FileCopyrightText: 2019 oemof developer group <contact@oemof.org>
 SPDX-License-Identifier: MIT
 """
+import numpy as np
 import pandas as pd
 import logging
 import warnings
 import os
+from functools import lru_cache
 from windpowerlib.tools import WindpowerlibUserWarning
 from typing import NamedTuple
 
@@ -22,17 +24,19 @@ class WindTurbine(object):
     ----------
     hub_height : float
         Hub height of the wind turbine in m.
-    power_curve : :pandas:`pandas.DataFrame<frame>` or dict (optional)
+    power_curve : :pandas:`pandas.DataFrame<frame>`, dict or :numpy:`numpy.ndarray` (optional)
         If provided directly sets the power curve. DataFrame/dictionary must
         have 'wind_speed' and 'value' columns/keys with wind speeds in m/s and
-        the corresponding power curve value in W. If not set the value is
+        the corresponding power curve value in W. A numpy structured array
+        needs 'wind_speed' and 'value' fields. If not set the value is
         retrieved from 'power_curve.csv' file in `path`. In that case a
         `turbine_type` is needed. Default: None.
-    power_coefficient_curve : :pandas:`pandas.DataFrame<frame>` or dict (optional)
+    power_coefficient_curve : :pandas:`pandas.DataFrame<frame>`, dict or :numpy:`numpy.ndarray` (optional)
         If provided directly sets the power coefficient curve.
         DataFrame/dictionary must have 'wind_speed' and 'value' columns/keys
         with wind speeds in m/s and the corresponding power coefficient curve
-        value. If not set the value is retrieved from
+        value. A numpy structured array needs 'wind_speed' and 'value'
+        fields. If not set the value is retrieved from
         'power_coefficient_curve.csv' file in `path`. In that case a
         `turbine_type` is needed. Default: None.
     turbine_type : str (optional)
@@ -190,9 +194,14 @@ class WindTurbine(object):
             warnings.warn(msg.format(turbine_type), WindpowerlibUserWarning)
         else:
             # power (coefficient) curve to pd.DataFrame in case of being dict
-            if isinstance(self.power_curve, dict):
+            # or numpy structured array
+            if isinstance(self.power_curve, dict) or _is_structured_array(
+                self.power_curve
+            ):
                 self.power_curve = pd.DataFrame(self.power_curve)
-            if isinstance(self.power_coefficient_curve, dict):
+            if isinstance(
+                self.power_coefficient_curve, dict
+            ) or _is_structured_array(self.power_coefficient_curve):
                 self.power_coefficient_curve = pd.DataFrame(
                     self.power_coefficient_curve
                 )
@@ -202,7 +211,7 @@ class WindTurbine(object):
             elif self.power_curve is not None:
                 msg = (
                     "Type of power curve of {} is {} but should be "
-                    "pd.DataFrame or dict."
+                    "pd.DataFrame, dict or numpy structured array."
                 )
                 raise TypeError(
                     msg.format(self.__repr__(), type(self.power_curve))
@@ -212,7 +221,7 @@ class WindTurbine(object):
             elif self.power_coefficient_curve is not None:
                 msg = (
                     "Type of power coefficient curve of {} is {} but "
-                    "should be pd.DataFrame or dict."
+                    "should be pd.DataFrame, dict or numpy structured array."
                 )
                 raise TypeError(
                     msg.format(
@@ -347,6 +356,32 @@ WindTurbineGroup.number_of_turbines.__doc__ = (
 )
 
 
+def _is_structured_array(curve):
+    r"""
+    Checks if a power (coefficient) curve is a numpy structured array.
+
+    Structured arrays with 'wind_speed' and 'value' fields are converted to a
+    DataFrame directly, like dictionaries.
+
+    """
+    return isinstance(curve, np.ndarray) and curve.dtype.names is not None
+
+
+@lru_cache(maxsize=16)
+def _read_turbine_data_file(path, modification_time, size):
+    r"""
+    Reads a turbine data csv file.
+
+    The parsed files are cached, as the same file is read for every wind
+    turbine that is initialised from it. `modification_time` and `size` are
+    only part of the cache key so that a changed file is read again.
+
+    The returned DataFrame is shared between calls and must not be altered.
+
+    """
+    return pd.read_csv(path, index_col=0)
+
+
 def get_turbine_data_from_file(turbine_type, path):
     r"""
     Fetches turbine data from a csv file.
@@ -387,9 +422,10 @@ def get_turbine_data_from_file(turbine_type, path):
     """
 
     try:
-        df = pd.read_csv(path, index_col=0)
+        stat = os.stat(path)
     except FileNotFoundError:
         raise FileNotFoundError("The file '{}' was not found.".format(path))
+    df = _read_turbine_data_file(path, stat.st_mtime_ns, stat.st_size)
     wpp_df = df[df.index == turbine_type].copy()
     # if turbine not in data file
     if wpp_df.shape[0] == 0:
@@ -404,7 +440,7 @@ def get_turbine_data_from_file(turbine_type, path):
         wpp_df = wpp_df.transpose().reset_index()
         wpp_df.columns = ["wind_speed", "value"]
         # transform wind speeds to floats
-        wpp_df["wind_speed"] = wpp_df["wind_speed"].apply(lambda x: float(x))
+        wpp_df["wind_speed"] = wpp_df["wind_speed"].astype(float)
         return wpp_df
 
 
@@ -185,8 +185,14 @@ class WindTurbineCluster(object):
             self
 
         """
-        # Assign wind farm power curves to wind farms of wind turbine cluster
+        # Assign wind farm power curves to wind farms of wind turbine cluster.
+        # A wind farm that is added to the cluster several times is only
+        # processed once.
+        assigned_farms = set()
         for farm in self.wind_farms:
+            if id(farm) in assigned_farms:
+                continue
+            assigned_farms.add(id(farm))
             # Assign hub heights (needed for power curve and later for
             # hub height of turbine cluster)
             farm.mean_hub_height()